@@ -10,6 +10,7 @@ set -euo pipefail
 #        with a defined session id before Codex launches (guards against regression #2025-11-13).
 # 2. `bash scripts/agentx.sh await --session <id>` (for the id created above)
 #      → waits for `/tmp/background-*/exitcode.log`, then prints the exit code plus the captured final message.
+#    2a. Repeat `--session` to await several runs at once; each is reported as soon as it finishes.
 # 3. `bash scripts/agentx.sh run --worktree /workspaces/rust-viterbo --prompt-file <sleep-prompt>`
 #      followed quickly by `bash scripts/agentx.sh abort --session <id>`
 #      → sends SIGTERM/SIGKILL to the recorded PID, sets status to `stopped`, and the exitcode log reflects the signal/non‑zero status.
@@ -35,8 +36,10 @@ CONFIG_DIR="${HOME}/.config/agentx"
 STATE_FILE="${CONFIG_DIR}/state.json"
 STATE_LOCK="${CONFIG_DIR}/state.lock"
 SESSION_DIR_ROOT="${CONFIG_DIR}/sessions"
-mkdir -p "$CONFIG_DIR" "$SESSION_DIR_ROOT"
-touch "$STATE_LOCK"
+# Steady state: everything already exists, so test with builtins and only fork mkdir
+# (or create the lock file) on first use.
+[[ -d "$SESSION_DIR_ROOT" ]] || mkdir -p "$CONFIG_DIR" "$SESSION_DIR_ROOT"
+[[ -e "$STATE_LOCK" ]] || : >>"$STATE_LOCK"
 if [[ ! -f "$STATE_FILE" ]]; then
   printf '{"sessions":{}}\n' >"$STATE_FILE"
 fi
@@ -54,7 +57,7 @@ Commands:
   run --worktree <path> [--session <id>] [--prompt "text"|--prompt-file file] [--message "text"] [--] [codex args...]
   abort --session <id>
   archive --session <id> [--delete-worktree]
-  await --session <id>
+  await --session <id> [--session <id> ...]
   help
 
 Notes:
@@ -92,7 +95,8 @@ for sess in sessions.values():
         continue
     exit_path = sess.get("exitcode_log")
     exit_code = sess.get("last_exitcode")
-    if exit_path and os.path.exists(exit_path):
+    if exit_path:
+        # Open directly; a missing log is just another failed read, not a separate stat.
         try:
             with open(exit_path, "r", encoding="utf-8") as ef:
                 text = ef.read().strip()
@@ -107,8 +111,10 @@ for sess in sessions.values():
     sess["updated_at"] = now
     changed = True
 if changed:
-    with open(path, "w", encoding="utf-8") as fh:
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
         json.dump(data, fh, indent=2, sort_keys=True)
+    os.replace(tmp, path)
 PY
 }
 
@@ -134,7 +140,7 @@ if sess is None:
     sys.exit(1)
 print(json.dumps(sess))
 PY
-  )"
+  )" || return 1
   printf '%s\n' "$json"
 }
 
@@ -152,44 +158,85 @@ if sid not in sessions:
     raise SystemExit(1)
 sessions[sid].update(patch)
 sessions[sid]["updated_at"] = patch.get("updated_at", time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()))
-with open(path, "w", encoding="utf-8") as fh:
+tmp = path + ".tmp"
+with open(tmp, "w", encoding="utf-8") as fh:
     json.dump(data, fh, indent=2, sort_keys=True)
+os.replace(tmp, path)
 PY
 }
 
-insert_session() {
-  local payload="$1"
-  PAYLOAD="$payload" flock "$STATE_LOCK" /usr/bin/env python3 - "$STATE_FILE" <<'PY'
-import json, os, sys
-payload = json.loads(os.environ["PAYLOAD"])
-path = sys.argv[1]
+# Patch the session if it is already tracked, otherwise insert it.
+# One locked read/write instead of a separate existence probe plus a second write.
+# Fields are passed as key=value arguments and serialised here, in the process that
+# writes the state, rather than assembled with separate jq invocations beforehand.
+upsert_session() {
+  local session_id="$1"
+  shift
+  flock "$STATE_LOCK" /usr/bin/env python3 - "$STATE_FILE" "$session_id" "$@" <<'PY'
+import json, os, sys, time
+path, sid = sys.argv[1], sys.argv[2]
+fields = dict(arg.partition("=")[::2] for arg in sys.argv[3:])
+if "pid" in fields:
+    fields["pid"] = int(fields["pid"])
+# Identity fields are fixed when the session is first recorded; later turns patch the rest.
+INSERT_ONLY = {"worktree", "branch", "slug", "session_dir", "created_at"}
 with open(path, "r", encoding="utf-8") as fh:
     data = json.load(fh)
 sessions = data.setdefault("sessions", {})
-sessions[payload["session_id"]] = payload
-with open(path, "w", encoding="utf-8") as fh:
+if sid in sessions:
+    patch = {key: value for key, value in fields.items() if key not in INSERT_ONLY}
+    sessions[sid].update(patch)
+    sessions[sid]["updated_at"] = patch.get("updated_at", time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()))
+else:
+    sessions[sid] = {"session_id": sid, **fields, "turns_completed": 0, "last_exitcode": None}
+tmp = path + ".tmp"
+with open(tmp, "w", encoding="utf-8") as fh:
     json.dump(data, fh, indent=2, sort_keys=True)
+os.replace(tmp, path)
 PY
 }
 
-session_exists() {
-  local session_id="$1"
-  if [[ -z "$session_id" ]]; then
-    return 1
+# Print the requested top-level fields of a session JSON object as one line separated by
+# \x1f (missing/null -> empty), so callers unpack several fields with a single jq fork:
+#   IFS=$'\x1f' read -r a b < <(session_fields "$json" field_a field_b)
+session_fields() {
+  local json="$1"
+  shift
+  jq -r '[$ARGS.positional[] as $k | .[$k] // "" | tostring] | join("\u001f")' --args "$@" <<<"$json"
+}
+
+# Resolve the checked-out branch of a worktree without forking git: walk up to the
+# nearest .git (a directory, or a `gitdir:` file for linked worktrees) and read HEAD.
+# Prints `HEAD` when detached, like `git rev-parse --abbrev-ref HEAD`; falls back to
+# git itself when the layout is unexpected.
+git_head_branch() {
+  local dir="$1" gitdir="" line=""
+  while [[ -n "$dir" ]]; do
+    if [[ -d "$dir/.git" ]]; then
+      gitdir="$dir/.git"
+      break
+    fi
+    if [[ -f "$dir/.git" ]]; then
+      read -r line <"$dir/.git" || true
+      gitdir="${line#gitdir: }"
+      [[ "$gitdir" == /* ]] || gitdir="$dir/$gitdir"
+      break
+    fi
+    [[ "$dir" == / ]] && break
+    dir="${dir%/*}"
+    [[ -n "$dir" ]] || dir=/
+  done
+  line=""
+  if [[ -n "$gitdir" && -r "$gitdir/HEAD" ]]; then
+    read -r line <"$gitdir/HEAD" || true
   fi
-  if flock "$STATE_LOCK" /usr/bin/env python3 - "$STATE_FILE" "$session_id" <<'PY' >/dev/null
-import json, sys
-path, sid = sys.argv[1], sys.argv[2]
-with open(path, "r", encoding="utf-8") as fh:
-    data = json.load(fh)
-if sid in data.get("sessions", {}):
-    raise SystemExit(0)
-raise SystemExit(1)
-PY
-  then
-    return 0
+  if [[ "$line" == "ref: refs/heads/"* ]]; then
+    printf '%s\n' "${line#ref: refs/heads/}"
+  elif [[ "$line" =~ ^[0-9a-f]{40,64}$ ]]; then
+    printf 'HEAD\n'
+  else
+    git -C "$1" rev-parse --abbrev-ref HEAD 2>/dev/null || echo unknown
   fi
-  return 1
 }
 
 list_cmd() {
@@ -224,40 +271,53 @@ def load_state(path):
     with open(path, "r", encoding="utf-8") as fh:
         return json.load(fh)
 
+def iter_session_files(base):
+    # Pre-order walk (files of a directory before its subdirectories), names sorted at
+    # every level; scandir entries carry their type, so no per-file stat or Path objects.
+    stack = [base]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir():
+                if not entry.is_symlink():
+                    subdirs.append(entry.path)
+            elif entry.name.endswith(".jsonl"):
+                yield entry.path
+        stack.extend(reversed(subdirs))
+
 def load_session_logs():
-    base = Path.home() / ".codex" / "sessions"
+    base = os.path.join(Path.home(), ".codex", "sessions")
     meta = {}
-    if not base.exists():
-        return meta
-    for root, _dirs, files in os.walk(base):
-        files.sort()
-        for name in files:
-            if not name.endswith(".jsonl"):
-                continue
-            path = Path(root) / name
-            try:
-                with open(path, "r", encoding="utf-8") as fh:
-                    first_line = fh.readline().strip()
-            except (OSError, UnicodeDecodeError):
-                continue
-            if not first_line:
-                continue
-            try:
-                entry = json.loads(first_line)
-            except json.JSONDecodeError:
-                continue
-            payload = entry.get("payload", {})
-            sid = payload.get("id")
-            if not sid or sid in meta:
-                continue
-            git_info = entry.get("git") or payload.get("git") or {}
-            meta[sid] = {
-                "session_id": sid,
-                "cwd": payload.get("cwd") or payload.get("workdir") or "",
-                "timestamp": payload.get("timestamp") or entry.get("timestamp") or "",
-                "path": str(path),
-                "branch": git_info.get("branch") or "",
-            }
+    for path in iter_session_files(base):
+        # Read the first line as bytes and let json decode it; no text-mode decode pass.
+        try:
+            with open(path, "rb") as fh:
+                first_line = fh.readline().strip()
+        except OSError:
+            continue
+        if not first_line:
+            continue
+        try:
+            entry = json.loads(first_line)
+        except ValueError:
+            continue
+        payload = entry.get("payload", {})
+        sid = payload.get("id")
+        if not sid or sid in meta:
+            continue
+        git_info = entry.get("git") or payload.get("git") or {}
+        meta[sid] = {
+            "session_id": sid,
+            "cwd": payload.get("cwd") or payload.get("workdir") or "",
+            "timestamp": payload.get("timestamp") or entry.get("timestamp") or "",
+            "path": path,
+            "branch": git_info.get("branch") or "",
+        }
     return meta
 
 def scan_process_table():
@@ -288,31 +348,38 @@ def scan_process_table():
         if not parts:
             continue
         try:
-            with open(stat_path, "r", encoding="utf-8") as fh:
-                stat_parts = fh.read().split()
+            with open(stat_path, "rb") as fh:
+                stat_raw = fh.read()
         except Exception:
             continue
-        if len(stat_parts) < 22:
+        # Split once after the parenthesised comm (which may itself contain spaces or
+        # parens); stat_parts[0] is then field 3 (state), so field N sits at N - 3.
+        stat_parts = stat_raw.rpartition(b") ")[2].split()
+        if len(stat_parts) < 20:
             continue
         try:
-            ppid = int(stat_parts[3])
+            ppid = int(stat_parts[1])
         except Exception:
             ppid = 0
-        try:
-            start_ticks = int(stat_parts[21])
-        except Exception:
-            start_ticks = None
-        start_iso = ""
-        if boot_time is not None and start_ticks is not None:
-            start_seconds = boot_time + (start_ticks / hz)
-            start_iso = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(start_seconds))
-        try:
-            cwd = os.readlink(cwd_path)
-        except Exception:
-            cwd = ""
         exe = parts[0]
         is_app_server = any(part == "app-server" or part.endswith("app-server") for part in parts[1:])
         is_codex = ("codex" in exe) and ("--yolo" in parts) and not is_app_server
+        # Every process is needed for the parent/child tree, but cwd and start time are
+        # only shown for codex rows: skip the readlink and time formatting for the rest.
+        start_iso = ""
+        cwd = ""
+        if is_codex:
+            try:
+                start_ticks = int(stat_parts[19])
+            except Exception:
+                start_ticks = None
+            if boot_time is not None and start_ticks is not None:
+                start_seconds = boot_time + (start_ticks / hz)
+                start_iso = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(start_seconds))
+            try:
+                cwd = os.readlink(cwd_path)
+            except Exception:
+                cwd = ""
         procs[pid] = {
             "pid": pid,
             "ppid": ppid,
@@ -420,12 +487,17 @@ if not filtered:
     print("No sessions recorded.")
     raise SystemExit(0)
 
-widths = {field: max(len(field), *(len(str(row.get(field, ""))) for row in filtered)) for field in fields}
-header = " ".join(field.ljust(widths[field]) for field in fields)
+# Project the rows onto the requested fields once, column by column; widths and output
+# are both computed from these string columns instead of re-stringifying each cell.
+columns = [[str(row.get(field, "")) for row in filtered] for field in fields]
+widths = [max(len(field), *map(len, column)) for field, column in zip(fields, columns)]
+# Specialise the row layout once for this field set: one format string, one call per row.
+row_format = " ".join(f"{{:<{width}}}" for width in widths)
+header = row_format.format(*fields)
 print(header)
 print("-" * len(header))
-for row in filtered:
-    print(" ".join(str(row.get(field, "")).ljust(widths[field]) for field in fields))
+for cells in zip(*columns):
+    print(row_format.format(*cells))
 PY
 }
 
@@ -462,46 +534,133 @@ PY
 }
 
 
-parse_background_output() {
-  local output="$1"
-  printf '%s\n' "$output" | awk -F= '/^BACKGROUND_/ {gsub(/\r/,""); print}'
-}
-
-extract_session_id() {
+# Follow the codex stdout log until it reveals the session id, in one process: lines are
+# parsed once as they arrive (no re-reading from the start) and the wait between reads
+# wakes early when the launched process exits. Gives up once the exit log is non-empty
+# or after ~20 s. Prints the id, or nothing.
+wait_for_session_id() {
   local log_path="$1"
-  /usr/bin/env python3 - "$log_path" <<'PY'
-import json, sys
-path = sys.argv[1]
+  local exit_log="$2"
+  local pid="$3"
+  /usr/bin/env python3 - "$log_path" "$exit_log" "$pid" <<'PY'
+import json, os, select, sys, time
+path, exit_log, pid = sys.argv[1], sys.argv[2], sys.argv[3]
+
+def session_id(line):
+    try:
+        data = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    if data.get("type") == "session_meta":
+        return data.get("payload", {}).get("id") or None
+    if data.get("type") == "thread.started":
+        thread_id = data.get("thread_id")
+        if thread_id and "-" in thread_id:
+            return thread_id.rsplit("-", 1)[-1]
+    return None
+
+poller = None
 try:
-    with open(path, "r", encoding="utf-8") as fh:
-        for line in fh:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                data = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            if data.get("type") == "session_meta":
-                payload = data.get("payload", {})
-                sid = payload.get("id")
-                if sid:
-                    print(sid)
-                    break
-            if data.get("type") == "thread.started":
-                thread_id = data.get("thread_id")
-                if thread_id and "-" in thread_id:
-                    print(thread_id.rsplit("-", 1)[-1])
-                    break
-except FileNotFoundError:
+    fd = os.pidfd_open(int(pid))
+    poller = select.poll()
+    poller.register(fd, select.POLLIN)
+except (AttributeError, OSError, ValueError):
     pass
+
+deadline = time.monotonic() + 20
+pending = b""
+fh = None
+while True:
+    if fh is None:
+        try:
+            fh = open(path, "rb")
+        except FileNotFoundError:
+            pass
+    if fh is not None:
+        pending += fh.read()
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            line = line.strip()
+            sid = session_id(line) if line else None
+            if sid:
+                print(sid)
+                raise SystemExit(0)
+    try:
+        if os.path.getsize(exit_log) > 0:
+            raise SystemExit(0)
+    except OSError:
+        pass
+    if time.monotonic() >= deadline:
+        raise SystemExit(0)
+    if poller is None:
+        time.sleep(0.25)
+    elif poller.poll(250):
+        # The process exited; its exit log follows, so stop waiting on the pidfd.
+        poller = None
+PY
+}
+
+# Block until <pid> exits, or for at most [timeout] seconds (returns 1 if it is still
+# running then). Uses a pidfd (works for non-child processes) so the wait is a single
+# poll() in the kernel instead of a sleep loop; probes /proc only when pidfds are
+# unavailable.
+wait_for_pid() {
+  local pid="$1"
+  local timeout="${2:-}"
+  /usr/bin/env python3 - "$pid" "$timeout" <<'PY'
+import os, select, sys, time
+pid = int(sys.argv[1])
+timeout = float(sys.argv[2]) if sys.argv[2] else None
+try:
+    fd = os.pidfd_open(pid)
+except ProcessLookupError:
+    raise SystemExit(0)
+except (AttributeError, OSError):
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while os.path.exists(f"/proc/{pid}"):
+        if deadline is not None and time.monotonic() >= deadline:
+            raise SystemExit(1)
+        time.sleep(0.1)
+    raise SystemExit(0)
+poller = select.poll()
+poller.register(fd, select.POLLIN)
+if not poller.poll(None if timeout is None else int(timeout * 1000)):
+    raise SystemExit(1)
+PY
+}
+
+# Block until the first of several PIDs exits and print it (one pidfd per PID, one poll).
+wait_for_any_pid() {
+  /usr/bin/env python3 - "$@" <<'PY'
+import os, select, sys, time
+pids = [int(arg) for arg in sys.argv[1:]]
+poller = select.poll()
+by_fd = {}
+try:
+    for pid in pids:
+        try:
+            fd = os.pidfd_open(pid)
+        except ProcessLookupError:
+            print(pid)
+            raise SystemExit(0)
+        by_fd[fd] = pid
+        poller.register(fd, select.POLLIN)
+except (AttributeError, OSError):
+    while True:
+        for pid in pids:
+            if not os.path.exists(f"/proc/{pid}"):
+                print(pid)
+                raise SystemExit(0)
+        time.sleep(0.1)
+fd, _ = poller.poll()[0]
+print(by_fd[fd])
 PY
 }
 
 ensure_session_dir() {
   local sid="$1"
   local dir="$SESSION_DIR_ROOT/$sid"
-  mkdir -p "$dir"
+  [[ -d "$dir" ]] || mkdir -p "$dir"
   printf '%s' "$dir"
 }
 
@@ -514,10 +673,12 @@ run_hook() {
     return
   fi
   echo "[agentx] running $var_name"
+  # Plain `bash -c` (hooks inherit our environment; no login-profile replay) exec'd from
+  # the subshell, so each hook costs one process instead of a subshell plus a login shell.
   (
     export AGENTX_HOOK_SESSION_ID="$session_id"
     cd "$dir"
-    bash -lc "$cmd"
+    exec bash -c "$cmd"
   )
 }
 
@@ -533,9 +694,9 @@ run_cmd() {
   fi
   worktree="$(realpath "$worktree")"
   local slug
-  slug="$(basename "$worktree")"
+  slug="${worktree##*/}"
   local branch
-  branch="$(git -C "$worktree" rev-parse --abbrev-ref HEAD 2>/dev/null || echo unknown)"
+  branch="$(git_head_branch "$worktree")"
   if [[ -n "${RUN_PROMPT_FILE:-}" && ! -f "$RUN_PROMPT_FILE" ]]; then
     echo "prompt file not found: $RUN_PROMPT_FILE" >&2
     exit 1
@@ -543,16 +704,15 @@ run_cmd() {
 
   local session_dir_hint=""
   if [[ -n "${RUN_SESSION:-}" ]]; then
-    if ! session_exists "$RUN_SESSION"; then
+    # One locked read answers both "does it exist?" and "what does it record?".
+    local resume_json
+    if ! resume_json="$(get_session_json "$RUN_SESSION" 2>/dev/null)"; then
       echo "session not found: $RUN_SESSION" >&2
       exit 1
     fi
-    local resume_json
-    resume_json="$(get_session_json "$RUN_SESSION")"
     local existing_status existing_worktree existing_dir
-    existing_status="$(echo "$resume_json" | jq -r '.status')"
-    existing_worktree="$(echo "$resume_json" | jq -r '.worktree // ""')"
-    existing_dir="$(echo "$resume_json" | jq -r '.session_dir // empty')"
+    IFS=$'\x1f' read -r existing_status existing_worktree existing_dir \
+      < <(session_fields "$resume_json" status worktree session_dir)
     if [[ "$existing_status" == "active" ]]; then
       echo "session $RUN_SESSION is already active; abort or await before rerunning" >&2
       exit 1
@@ -603,10 +763,10 @@ run_hook "AGENTX_HOOK_BEFORE_TURN_LAUNCH" "$worktree" "$session_id"
     exit 1
   fi
   echo "$bg_output"
-  local parsed
-  parsed="$(parse_background_output "$bg_output")"
+  # Pick the BACKGROUND_* lines out of the launcher output in-shell (no awk pipeline).
   local bg_pid stdout_log stderr_log log_dir exit_log
   while IFS='=' read -r key value; do
+    value="${value%$'\r'}"
     case "$key" in
       BACKGROUND_PID) bg_pid="$value" ;;
       BACKGROUND_LOG_DIR) log_dir="$value" ;;
@@ -614,7 +774,7 @@ run_hook "AGENTX_HOOK_BEFORE_TURN_LAUNCH" "$worktree" "$session_id"
       BACKGROUND_STDERR) stderr_log="$value" ;;
       BACKGROUND_EXITCODE) exit_log="$value" ;;
     esac
-  done <<<"$parsed"
+  done <<<"$bg_output"
   if [[ -z "$stdout_log" ]]; then
     echo "unable to parse background stdout log path" >&2
     exit 1
@@ -623,17 +783,10 @@ run_hook "AGENTX_HOOK_BEFORE_TURN_LAUNCH" "$worktree" "$session_id"
   local resolved_session_id="$session_id"
   local codex_exit_status=""
   if [[ -z "$resolved_session_id" ]]; then
-    for attempt in {1..80}; do
-      resolved_session_id="$(extract_session_id "$stdout_log")"
-      if [[ -n "$resolved_session_id" ]]; then
-        break
-      fi
-      if [[ -s "$exit_log" ]]; then
-        codex_exit_status="$(cat "$exit_log" 2>/dev/null || true)"
-        break
-      fi
-      sleep 0.25
-    done
+    resolved_session_id="$(wait_for_session_id "$stdout_log" "$exit_log" "$bg_pid")"
+    if [[ -z "$resolved_session_id" && -s "$exit_log" ]]; then
+      codex_exit_status="$(cat "$exit_log" 2>/dev/null || true)"
+    fi
   fi
 
   if [[ -z "$resolved_session_id" ]]; then
@@ -649,39 +802,20 @@ run_hook "AGENTX_HOOK_BEFORE_TURN_LAUNCH" "$worktree" "$session_id"
 
   local now
   now="$(ts_utc)"
-  if session_exists "$resolved_session_id"; then
-    local patch_json
-    patch_json="$(jq -n \
-      --arg status "active" \
-      --arg pid "$bg_pid" \
-      --arg stdout "$stdout_log" \
-      --arg stderr "$stderr_log" \
-      --arg exitlog "$exit_log" \
-      --arg prompt "$prompt_text" \
-    --arg lastmsg "$last_message_path" \
-      --arg updated "$now" \
-      '{status:$status,pid:($pid|tonumber),stdout_log:$stdout,stderr_log:$stderr,exitcode_log:$exitlog,last_message_path:$lastmsg,prompt_snapshot:$prompt,updated_at:$updated}')"
-    apply_session_patch "$resolved_session_id" "$patch_json"
-  else
-    local payload
-    payload="$(jq -n \
-      --arg sid "$resolved_session_id" \
-      --arg wt "$worktree" \
-      --arg br "$branch" \
-      --arg slug "$slug" \
-      --arg status "active" \
-      --arg pid "$bg_pid" \
-      --arg stdout "$stdout_log" \
-      --arg stderr "$stderr_log" \
-      --arg exitlog "$exit_log" \
-      --arg prompt "$prompt_text" \
-      --arg sessiondir "$session_dir" \
-      --arg lastmsg "$last_message_path" \
-      --arg created "$now" \
-      --arg updated "$now" \
-      '{session_id:$sid, worktree:$wt, branch:$br, slug:$slug, status:$status, pid:($pid|tonumber), stdout_log:$stdout, stderr_log:$stderr, exitcode_log:$exitlog, session_dir:$sessiondir, last_message_path:$lastmsg, prompt_snapshot:$prompt, created_at:$created, updated_at:$updated, turns_completed:0, last_exitcode:null}')"
-    insert_session "$payload"
-  fi
+  upsert_session "$resolved_session_id" \
+    status=active \
+    pid="$bg_pid" \
+    worktree="$worktree" \
+    branch="$branch" \
+    slug="$slug" \
+    stdout_log="$stdout_log" \
+    stderr_log="$stderr_log" \
+    exitcode_log="$exit_log" \
+    session_dir="$session_dir" \
+    last_message_path="$last_message_path" \
+    prompt_snapshot="$prompt_text" \
+    created_at="$now" \
+    updated_at="$now"
   echo "Session $resolved_session_id running (PID $bg_pid). Stdout: $stdout_log"
 
   run_hook "AGENTX_HOOK_AFTER_TURN_LAUNCH" "$worktree" "$resolved_session_id"
@@ -698,18 +832,21 @@ abort_cmd() {
     echo "session not found: $session_id" >&2
     exit 1
   fi
-  local pid exit_log
-  pid="$(echo "$json" | jq -r '.pid // empty')"
-  exit_log="$(echo "$json" | jq -r '.exitcode_log // empty')"
+  local pid exit_log worktree
+  IFS=$'\x1f' read -r pid exit_log worktree < <(session_fields "$json" pid exitcode_log worktree)
   if [[ -z "$pid" ]]; then
     echo "session not running (no pid)" >&2
     exit 1
   fi
   if kill -0 "$pid" 2>/dev/null; then
     kill "$pid" 2>/dev/null || true
-    sleep 1
-    kill -KILL "$pid" 2>/dev/null || true
-    echo "sent SIGTERM/SIGKILL to $pid"
+    # Give it up to a second to exit on SIGTERM, returning as soon as it does.
+    if wait_for_pid "$pid" 1; then
+      echo "sent SIGTERM to $pid"
+    else
+      kill -KILL "$pid" 2>/dev/null || true
+      echo "sent SIGTERM/SIGKILL to $pid"
+    fi
   else
     echo "process $pid not running" >&2
   fi
@@ -717,8 +854,6 @@ abort_cmd() {
     printf '143\n' >"$exit_log" 2>/dev/null || true
   fi
   apply_session_patch "$session_id" '{"status":"stopped","pid":null}'
-  local worktree
-  worktree="$(echo "$json" | jq -r '.worktree')"
   run_hook "AGENTX_HOOK_AFTER_TURN_ABORTED" "$worktree" "$session_id"
 }
 
@@ -734,16 +869,14 @@ archive_cmd() {
     echo "session not found: $session_id" >&2
     exit 1
   fi
-  local status
-  status="$(echo "$json" | jq -r '.status')"
+  local status worktree
+  IFS=$'\x1f' read -r status worktree < <(session_fields "$json" status worktree)
   if [[ "$status" == "active" ]]; then
     echo "session $session_id is still active; abort or await before archiving" >&2
     exit 1
   fi
   apply_session_patch "$session_id" '{"status":"archived","pid":null}'
   if [[ "$delete_worktree" == "1" ]]; then
-    local worktree
-    worktree="$(echo "$json" | jq -r '.worktree')"
     if [[ -n "$worktree" && -d "$worktree" ]]; then
       local real
       real="$(realpath "$worktree")"
@@ -768,15 +901,21 @@ await_cmd() {
     echo "session not found: $session_id" >&2
     exit 1
   fi
-  local exit_log last_message worktree
-  exit_log="$(echo "$json" | jq -r '.exitcode_log')"
-  last_message="$(echo "$json" | jq -r '.last_message_path')"
-  worktree="$(echo "$json" | jq -r '.worktree')"
+  local exit_log last_message worktree pid
+  IFS=$'\x1f' read -r exit_log last_message worktree pid \
+    < <(session_fields "$json" exitcode_log last_message_path worktree pid)
   if [[ -z "$exit_log" ]]; then
     echo "no exitcode log recorded" >&2
     exit 1
   fi
   echo "Waiting for session $session_id (exit log: $exit_log)"
+  # Only block on the PID while the turn has not logged its exit yet: once the log is
+  # written the recorded PID may already belong to an unrelated process.
+  if [[ -n "$pid" && "$pid" != "null" && ! -s "$exit_log" ]]; then
+    wait_for_pid "$pid" || true
+  fi
+  # background.sh writes the exit log from its EXIT trap, so after the PID is gone this
+  # loop normally sees it on the first check. It still covers sessions without a PID.
   while true; do
     if [[ -s "$exit_log" ]]; then
       local code
@@ -809,7 +948,39 @@ await_cmd() {
   else
     run_hook "AGENTX_HOOK_AFTER_TURN_END_SUCCESS" "$worktree" "$session_id"
   fi
-  refresh_state
+}
+
+# Await several sessions at once: finalize each one (exit code, final message, hooks) in
+# the order their turns finish instead of blocking on them one by one.
+await_many_cmd() {
+  local -A pending=()
+  local ready=()
+  local rc=0 sid json pid exit_log
+  for sid in "$@"; do
+    if ! json="$(get_session_json "$sid" 2>/dev/null)"; then
+      echo "session not found: $sid" >&2
+      rc=1
+      continue
+    fi
+    IFS=$'\x1f' read -r pid exit_log < <(session_fields "$json" pid exitcode_log)
+    # A session that already logged its exit is ready now; its recorded PID may have
+    # been reused by an unrelated process, so never open a pidfd for it.
+    if [[ -n "$pid" && "$pid" != "null" && ! ( -n "$exit_log" && -s "$exit_log" ) ]]; then
+      pending[$pid]="$sid"
+    else
+      ready+=("$sid")
+    fi
+  done
+  for sid in "${ready[@]}"; do
+    ( await_cmd "$sid" ) || rc=1
+  done
+  while (( ${#pending[@]} > 0 )); do
+    pid="$(wait_for_any_pid "${!pending[@]}")"
+    sid="${pending[$pid]}"
+    unset "pending[$pid]"
+    ( await_cmd "$sid" ) || rc=1
+  done
+  return "$rc"
 }
 
 COMMAND="${1:-}"
@@ -893,15 +1064,19 @@ case "$COMMAND" in
     archive_cmd "$SESSION_ID" "$DELETE_FLAG"
     ;;
   await)
-    SESSION_ID=""
+    AWAIT_SESSIONS=()
     while [[ $# -gt 0 ]]; do
       case "$1" in
-        --session) SESSION_ID="$2"; shift 2 ;;
+        --session) AWAIT_SESSIONS+=("$2"); shift 2 ;;
         --help|-h) usage; exit 0 ;;
         *) echo "unknown flag $1"; exit 2 ;;
       esac
     done
-    await_cmd "$SESSION_ID"
+    if (( ${#AWAIT_SESSIONS[@]} > 1 )); then
+      await_many_cmd "${AWAIT_SESSIONS[@]}"
+    else
+      await_cmd "${AWAIT_SESSIONS[0]:-}"
+    fi
     ;;
   *)
     echo "unknown command: $COMMAND" >&2
@@ -87,8 +87,14 @@ if [[ -s "$flag_file" ]]; then
   rc=124
 fi
 
-kill -TERM "-$pgid" 2>/dev/null || true
-sleep 1
-kill -KILL "-$pgid" 2>/dev/null || true
+# Reap leftover grandchildren. Most commands leave none, so only pay for the grace
+# period when the group is still populated, and end it as soon as the group empties.
+if kill -TERM "-$pgid" 2>/dev/null; then
+  for _ in {1..20}; do
+    kill -0 "-$pgid" 2>/dev/null || break
+    sleep 0.05
+  done
+  kill -KILL "-$pgid" 2>/dev/null || true
+fi
 
 exit "$rc"
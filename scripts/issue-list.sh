@@ -10,67 +10,109 @@ fi
 
 ROOT_DIR="$ROOT" ISSUE_DIR="$ISSUE_DIR" python3 <<'PY'
 import ast
+import re
+import sys
 from pathlib import Path
 
 import os
 
+# Front matter is the block between a leading `---` line and the next `---` line (or EOF);
+# each `key: value  # comment` line inside it is one field.
+FRONTMATTER_RE = re.compile(
+    r"\A[ \t]*---[ \t]*\n(.*?)(?:(?P<close>^[ \t]*---[ \t]*$)\n?|\Z)", re.S | re.M
+)
+KV_RE = re.compile(r"^([^:\n]*):([^#\n]*)", re.M)
+TITLE_RE = re.compile(r"^[ \t]*#[# ]*(.*?)[ \t]*$", re.M)
+
+
+def as_str(parsed):
+    return str(parsed)
+
+
+def as_list(parsed):
+    return [str(x) for x in parsed]
+
+
+# Header keys we report, mapped to their converter. Keys are interned so the per-line
+# dispatch below is a dict hit on a shared string; other keys are skipped unparsed.
+FIELD_PARSERS = {
+    sys.intern("status"): as_str,
+    sys.intern("owners"): as_list,
+    sys.intern("assignees"): as_list,
+    sys.intern("tags"): as_list,
+    sys.intern("created_at"): as_str,
+    sys.intern("updated_at"): as_str,
+}
+EMPTY_FIELDS = {"status": "", "owners": [], "assignees": [], "tags": [], "created_at": "", "updated_at": ""}
+
+
+def read_head(path, chunk_size=4096):
+    """Read only as much of `path` as covers the front matter and the first heading."""
+    text = ""
+    with open(path) as fh:
+        while True:
+            chunk = fh.read(chunk_size)
+            if not chunk:
+                return text
+            text += chunk
+            match = FRONTMATTER_RE.match(text)
+            if match is None:
+                if text.lstrip(" \t").startswith("---") and "\n" not in text:
+                    continue
+                body_start = 0
+            elif match.group("close") is None or match.end("close") == len(text):
+                continue
+            else:
+                body_start = match.end()
+            heading = TITLE_RE.search(text, body_start)
+            if heading and heading.end() < len(text):
+                return text
+
 root = Path(os.environ["ISSUE_DIR"])
-files = sorted(p for p in root.glob("*.md"))
-for path in files:
-    if path.name == "template.md":
-        continue
-    status = ""
-    owners = []
-    assignees = []
-    tags = []
-    created = ""
-    updated = ""
+rel_root = root.relative_to(Path(os.environ["ROOT_DIR"]))
+# One scandir pass: names come straight from the directory entries (d_type answers
+# is_file without a stat), and paths are only joined for the files we actually read.
+with os.scandir(root) as entries:
+    names = sorted(
+        entry.name
+        for entry in entries
+        if entry.name.endswith(".md")
+        and entry.name != "template.md"
+        and entry.is_file()
+    )
+for name in names:
+    path = os.path.join(root, name)
+    fields = dict(EMPTY_FIELDS)
     title = ""
-    lines = path.read_text().splitlines()
-    if not lines:
+    text = read_head(path)
+    if not text:
         continue
-    idx = 0
-    if lines[idx].strip() == "---":
-        idx += 1
-        while idx < len(lines):
-            line = lines[idx]
-            if line.strip() == "---":
-                idx += 1
-                break
-            if ":" in line:
-                key, val = line.split(":", 1)
-                val = val.split("#", 1)[0].strip()
-                key = key.strip()
-                if val.startswith("[") and val.endswith("]"):
-                    try:
-                        parsed = ast.literal_eval(val)
-                    except Exception:
-                        parsed = []
-                    if not isinstance(parsed, list):
-                        parsed = [str(parsed)]
-                else:
-                    parsed = val
-                if key == "status":
-                    status = str(parsed)
-                elif key == "owners":
-                    owners = [str(x) for x in parsed]
-                elif key == "assignees":
-                    assignees = [str(x) for x in parsed]
-                elif key == "tags":
-                    tags = [str(x) for x in parsed]
-                elif key == "created_at":
-                    created = str(parsed)
-                elif key == "updated_at":
-                    updated = str(parsed)
-            idx += 1
-    for j in range(idx, len(lines)):
-        line = lines[j].strip()
-        if line.startswith("#"):
-            title = line.lstrip("# ")
-            break
-    owners_str = ",".join(owners)
-    assignees_str = ",".join(assignees)
-    tags_str = ",".join(tags)
-    rel_path = path.relative_to(Path(os.environ["ROOT_DIR"]))
-    print(f"{status}\t{owners_str}\t{assignees_str}\t{tags_str}\t{rel_path}\t{title}")
+    body_start = 0
+    match = FRONTMATTER_RE.match(text)
+    if match:
+        body_start = match.end()
+        for key, val in KV_RE.findall(match.group(1)):
+            key = sys.intern(key.strip())
+            convert = FIELD_PARSERS.get(key)
+            if convert is None:
+                continue
+            val = val.strip()
+            if val.startswith("[") and val.endswith("]"):
+                try:
+                    parsed = ast.literal_eval(val)
+                except Exception:
+                    parsed = []
+                if not isinstance(parsed, list):
+                    parsed = [str(parsed)]
+            else:
+                parsed = val
+            fields[key] = convert(parsed)
+    heading = TITLE_RE.search(text, body_start)
+    if heading:
+        title = heading.group(1)
+    owners_str = ",".join(fields["owners"])
+    assignees_str = ",".join(fields["assignees"])
+    tags_str = ",".join(fields["tags"])
+    rel_path = rel_root / name
+    print(f"{fields['status']}\t{owners_str}\t{assignees_str}\t{tags_str}\t{rel_path}\t{title}")
 PY
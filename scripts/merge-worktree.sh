@@ -113,9 +113,10 @@ else
   fi
 fi
 
-SOURCE_BRANCH="$(git -C "$SOURCE_PATH" rev-parse --abbrev-ref HEAD)"
-SOURCE_COMMIT="$(git -C "$SOURCE_PATH" rev-parse HEAD)"
-TARGET_COMMIT="$(git -C "$ROOT" rev-parse "$TARGET_BRANCH")"
+# One rev-parse for all three lookups; worktrees share refs, so the target branch
+# resolves the same from the source worktree as from $ROOT.
+REV_INFO="$(git -C "$SOURCE_PATH" rev-parse HEAD "$TARGET_BRANCH" --abbrev-ref HEAD)"
+{ read -r SOURCE_COMMIT; read -r TARGET_COMMIT; read -r SOURCE_BRANCH; } <<<"$REV_INFO"
 
 echo "[merge] source branch: $SOURCE_BRANCH ($SOURCE_COMMIT)"
 echo "[merge] target branch: $TARGET_BRANCH ($TARGET_COMMIT)"
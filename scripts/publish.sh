@@ -34,7 +34,7 @@ echo "🧹 Clearing old contents..."
 find "$TMP_DIR" -mindepth 1 -maxdepth 1 ! -name .git -exec rm -rf {} +
 
 echo "📦 Copying new site..."
-cp -r "$BOOK_DIR"/* "$TMP_DIR"/
+cp -r --reflink=auto "$BOOK_DIR"/* "$TMP_DIR"/
 touch "$TMP_DIR/.nojekyll"
 
 echo "✅ Committing and pushing..."
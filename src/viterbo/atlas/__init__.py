@@ -1,7 +1,7 @@
 """Atlas experiment namespace."""
 
 from .config import AtlasConfig, OutputConfig, SourceConfig
-from .dataset import build_dataset, write_dataset
+from .dataset import build_and_write_dataset, build_dataset, write_dataset
 from .torch_dataset import AtlasTorchDataset, AtlasTorchDatasetConfig
 
 __all__ = [
@@ -10,6 +10,7 @@ __all__ = [
     "SourceConfig",
     "AtlasTorchDataset",
     "AtlasTorchDatasetConfig",
+    "build_and_write_dataset",
     "build_dataset",
     "write_dataset",
 ]
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Mapping, MutableMapping, Sequence
+from typing import Any, Mapping, Sequence
 
 
 @dataclass(frozen=True)
@@ -45,11 +46,14 @@ class AtlasConfig:
 
     @classmethod
     def from_file(cls, path: Path) -> "AtlasConfig":
-        import json
+        """Load a config file, reusing the parsed result while the file is unchanged.
 
-        with path.open("r", encoding="utf-8") as handle:
-            payload = json.load(handle)
-        return cls.from_mapping(payload, base_dir=path.parent)
+        The cache is keyed on the file's identity and mtime (plus cwd, which relative
+        output paths resolve against), so callers share one instance per version of
+        the file: treat the returned config, including its source params, as read-only.
+        """
+        st = path.stat()
+        return _load_cached(cls, str(path), st.st_mtime_ns, st.st_size, str(Path.cwd()))
 
     @staticmethod
     def _parse_out(payload: Mapping[str, Any], base_dir: Path) -> OutputConfig:
@@ -70,17 +74,16 @@ class AtlasConfig:
         for entry in payload:
             if not isinstance(entry, Mapping):
                 raise ValueError("each source entry must be an object")
-            entry_mut: MutableMapping[str, Any] = dict(entry)
-            name = str(entry_mut.get("name") or entry_mut.get("family"))
-            family = str(entry_mut.get("family") or entry_mut.get("name"))
-            rows = AtlasConfig._infer_row_count(entry_mut)
-            params = dict(entry_mut.get("params") or {})
-            seed = entry_mut.get("seed")
+            # Read-only access: look each key up once instead of copying the entry.
+            raw_name = entry.get("name")
+            raw_family = entry.get("family")
+            params = dict(entry.get("params") or {})
+            seed = entry.get("seed")
             specs.append(
                 SourceConfig(
-                    name=name,
-                    family=family,
-                    rows=rows,
+                    name=str(raw_name or raw_family),
+                    family=str(raw_family or raw_name),
+                    rows=AtlasConfig._infer_row_count(entry.get("rows"), params, raw_name),
                     params=params,
                     seed=int(seed) if seed is not None else None,
                 )
@@ -88,18 +91,27 @@ class AtlasConfig:
         return specs
 
     @staticmethod
-    def _infer_row_count(entry: Mapping[str, Any]) -> int:
-        rows = entry.get("rows")
+    def _infer_row_count(rows: Any, params: Mapping[str, Any], name: Any) -> int:
         if rows is not None:
             rows_int = int(rows)
             if rows_int <= 0:
-                raise ValueError(f"source '{entry.get('name')}' must have positive rows")
+                raise ValueError(f"source '{name}' must have positive rows")
             return rows_int
-        params = entry.get("params") or {}
         members = params.get("members")
         if isinstance(members, Sequence) and members:
             return len(members)
-        raise ValueError(f"source '{entry.get('name')}' missing 'rows' and no inferable count")
+        raise ValueError(f"source '{name}' missing 'rows' and no inferable count")
+
+
+@functools.lru_cache(maxsize=16)
+def _load_cached(
+    cls: type[AtlasConfig], path: str, mtime_ns: int, size: int, cwd: str
+) -> AtlasConfig:
+    import json
+
+    # json.loads detects the UTF-8 encoding of bytes itself; no text-mode decode pass.
+    payload = json.loads(Path(path).read_bytes())
+    return cls.from_mapping(payload, base_dir=Path(path).parent)
 
 
 def _resolve_path(candidate: str, base_dir: Path) -> Path:
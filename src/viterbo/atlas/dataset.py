@@ -4,6 +4,8 @@ from pathlib import Path
 from typing import Iterable, Iterator
 
 import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from viterbo.provenance import write as write_provenance
 
@@ -12,37 +14,146 @@ from .sources import source_from_spec
 from .types import AtlasRow
 
 
+# Column order and dtypes of the atlas table (see docs/src/thesis/atlas-dataset.md).
+# Rows are accumulated column-wise and handed to Polars with this schema, so no
+# per-row dicts are built and nothing is left for Polars to infer or transpose.
+# Columns in DERIVED_COLUMNS are not accumulated at all: `_complete_batch`
+# computes them for a whole batch at once as Polars expressions.
+ATLAS_SCHEMA: dict[str, pl.DataType] = {
+    "row_id": pl.Int64(),
+    "family": pl.Utf8(),
+    "family_name": pl.Utf8(),
+    "family_parameters": pl.Utf8(),
+    "replay_token": pl.Utf8(),
+    "vertex_count": pl.Int64(),
+    "halfspace_count": pl.Int64(),
+    "vertices": pl.List(pl.List(pl.Float64())),
+    "halfspaces": pl.List(pl.List(pl.Float64())),
+    "volume": pl.Float64(),
+    "capacity_ehz": pl.Float64(),
+    "dominant_orbit": pl.Utf8(),
+    "systolic_ratio": pl.Float64(),
+}
+
+DERIVED_COLUMNS = ("row_id", "vertex_count", "halfspace_count", "systolic_ratio")
+_STORED_SCHEMA = {
+    name: dtype for name, dtype in ATLAS_SCHEMA.items() if name not in DERIVED_COLUMNS
+}
+
+# The same schema in Arrow terms, for streaming record batches straight to Parquet.
+ATLAS_ARROW_SCHEMA: pa.Schema = pl.DataFrame(schema=ATLAS_SCHEMA).to_arrow().schema
+
+# Rows buffered per Parquet record batch by `build_and_write_dataset`.
+DEFAULT_BATCH_SIZE = 16_384
+
+
 def build_dataset(cfg: AtlasConfig) -> pl.DataFrame:
-    rows = list(_iter_records(cfg))
-    if not rows:
+    columns = _empty_columns()
+    for row in _iter_rows(cfg):
+        row.append_to(columns)
+    if not columns["family"]:
         raise ValueError("atlas dataset produced zero rows")
-    return pl.DataFrame(rows)
+    return _complete_batch(columns, 0)
 
 
 def write_dataset(cfg: AtlasConfig, df: pl.DataFrame) -> Path:
     out_path = cfg.out.dataset
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    df.write_parquet(out_path, compression="zstd")
+    # Same row-group layout and column statistics as the streaming writer, so readers can
+    # prune row groups (e.g. by family_name) whichever path wrote the file.
+    df.write_parquet(
+        out_path, compression="zstd", statistics=True, row_group_size=DEFAULT_BATCH_SIZE
+    )
+    _write_sidecar(cfg, out_path, len(df))
+    return out_path
+
+
+def build_and_write_dataset(
+    cfg: AtlasConfig, *, batch_size: int = DEFAULT_BATCH_SIZE
+) -> tuple[Path, int]:
+    """Generate the dataset and stream it to Parquet one record batch at a time.
+
+    Only `batch_size` rows are resident at once, unlike `build_dataset` + `write_dataset`
+    which hold the whole table in memory. Returns the output path and the row count.
+    """
+    out_path = cfg.out.dataset
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    # Stream into a sibling temp file and swap it in only once it is complete, so a
+    # build that fails midway leaves the previous dataset (and its sidecar) intact.
+    tmp_path = out_path.with_suffix(out_path.suffix + ".tmp")
+    columns = _empty_columns()
+    rows = 0
+    flushed = 0
+    try:
+        with pq.ParquetWriter(
+            tmp_path, ATLAS_ARROW_SCHEMA, compression="zstd", write_statistics=True
+        ) as writer:
+            for row in _iter_rows(cfg):
+                row.append_to(columns)
+                rows += 1
+                if rows - flushed == batch_size:
+                    _write_batch(writer, columns, flushed)
+                    flushed = rows
+            if rows > flushed:
+                _write_batch(writer, columns, flushed)
+        if rows == 0:
+            raise ValueError("atlas dataset produced zero rows")
+        tmp_path.replace(out_path)
+    finally:
+        # A no-op after the swap; otherwise drops the partial file.
+        tmp_path.unlink(missing_ok=True)
+    _write_sidecar(cfg, out_path, rows)
+    return out_path, rows
+
+
+def _empty_columns() -> dict[str, list[object]]:
+    return {name: [] for name in _STORED_SCHEMA}
+
+
+def _complete_batch(columns: dict[str, list[object]], first_row_id: int) -> pl.DataFrame:
+    """Frame a batch starting at `first_row_id`, adding the derived columns in schema order."""
+    stored = pl.DataFrame(columns, schema=_STORED_SCHEMA)
+    volume, capacity = pl.col("volume"), pl.col("capacity_ehz")
+    return stored.with_columns(
+        pl.int_range(first_row_id, first_row_id + pl.len(), dtype=pl.Int64).alias("row_id"),
+        pl.col("vertices").list.len().cast(pl.Int64).alias("vertex_count"),
+        pl.col("halfspaces").list.len().cast(pl.Int64).alias("halfspace_count"),
+        # The only place the systolic ratio is computed: NaN if either input is NaN or
+        # the volume is not positive.
+        pl.when(volume.is_not_nan() & capacity.is_not_nan() & (volume > 0.0))
+        .then(capacity * capacity / (2.0 * volume))
+        .otherwise(float("nan"))
+        .alias("systolic_ratio"),
+    ).select(ATLAS_SCHEMA.keys())
+
+
+def _write_batch(
+    writer: pq.ParquetWriter, columns: dict[str, list[object]], first_row_id: int
+) -> None:
+    writer.write_table(_complete_batch(columns, first_row_id).to_arrow())
+    for values in columns.values():
+        values.clear()
+
+
+def _write_sidecar(cfg: AtlasConfig, out_path: Path, rows: int) -> None:
     write_provenance(
         out_path,
         {
             "config_version": cfg.version,
             "seed": cfg.seed,
-            "rows": len(df),
+            "rows": rows,
         },
         {
             "command": "python -m viterbo.atlas.stage_build --config <file>",
             "exit_code": 0,
         },
+        # Rewritten with the dataset on every build; a torn sidecar is just rebuilt.
+        atomic=False,
     )
-    return out_path
 
 
-def _iter_records(cfg: AtlasConfig) -> Iterator[dict[str, object]]:
-    global_row = 0
+def _iter_rows(cfg: AtlasConfig) -> Iterator[AtlasRow]:
     for idx, spec in enumerate(cfg.sources):
         seed = cfg.seed + idx * 1_000_003
         source = source_from_spec(spec, seed)
-        for row in source.generate():
-            yield row.to_record(global_row)
-            global_row += 1
+        yield from source.generate()
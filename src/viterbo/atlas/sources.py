@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import functools
 import itertools
-from typing import Any, Iterator
+from types import MappingProxyType
+from typing import Any, Iterator, Mapping
+
+import numpy as np
 
 from viterbo import _native as _native_impl
 
 from .config import SourceConfig
-from .types import AtlasRow, PolytopeRecord, build_atlas_row
+from .types import AtlasRow, PolytopeRecord, build_atlas_row, build_atlas_rows
 
 _native: Any = _native_impl
 
@@ -42,87 +46,91 @@ class AtlasSource:
 
 class SymmetricHalfspaceSource(AtlasSource):
     def generate(self) -> Iterator[AtlasRow]:
-        for idx in range(self.spec.rows):
-            sample_seed = self.seed + idx
-            poly = _native.rand4_symmetric_halfspace_sample(self.spec.params, int(sample_seed))
-            yield build_atlas_row(
-                family="symmetric_halfspaces",
-                family_name=self.spec.name,
-                family_parameters={
-                    "params": self.spec.params,
-                    "seed": sample_seed,
-                },
-                replay_token={"seed": sample_seed},
-                poly_payload=poly,
-            )
+        base_seed = int(self.seed)
+        name, params = self.spec.name, self.spec.params
+        # Payloads are sampled lazily, so a large source never holds them all.
+        yield from build_atlas_rows(
+            family="symmetric_halfspaces",
+            family_name=name,
+            items=(
+                (
+                    {"params": params, "seed": seed},
+                    {"seed": seed},
+                    _native.rand4_symmetric_halfspace_sample(params, seed),
+                )
+                for seed in range(base_seed, base_seed + int(self.spec.rows))
+            ),
+        )
 
 
 class MahlerProductSource(AtlasSource):
     def generate(self) -> Iterator[AtlasRow]:
-        base_seed = self.seed
-        for idx in range(self.spec.rows):
-            poly = _native.rand4_mahler_product_sample(self.spec.params, int(base_seed), int(idx))
-            yield build_atlas_row(
-                family="mahler_products",
-                family_name=self.spec.name,
-                family_parameters={
-                    "params": self.spec.params,
-                    "seed": base_seed,
-                    "index": idx,
-                },
-                replay_token={"seed": base_seed, "index": idx},
-                poly_payload=poly,
-            )
+        base_seed = int(self.seed)
+        name, params = self.spec.name, self.spec.params
+        yield from build_atlas_rows(
+            family="mahler_products",
+            family_name=name,
+            items=(
+                (
+                    {"params": params, "seed": base_seed, "index": idx},
+                    {"seed": base_seed, "index": idx},
+                    _native.rand4_mahler_product_sample(params, base_seed, idx),
+                )
+                for idx in range(int(self.spec.rows))
+            ),
+        )
 
 
 class RegularProductSource(AtlasSource):
     def generate(self) -> Iterator[AtlasRow]:
+        name, params = self.spec.name, self.spec.params
+        rows = int(self.spec.rows)
         rows_yielded = 0
-        pair_index = 0
-        while rows_yielded < self.spec.rows:
-            maybe_poly = _native.rand4_regular_product_sample(self.spec.params, int(pair_index))
-            pair_index += 1
-            if maybe_poly is None:
-                if rows_yielded == 0:
-                    raise ValueError(f"regular product source '{self.spec.name}' produced no rows")
-                break
-            yield build_atlas_row(
-                family="regular_products",
-                family_name=self.spec.name,
-                family_parameters={
-                    "params": self.spec.params,
-                    "pair_index": pair_index - 1,
-                },
-                replay_token={"pair_index": pair_index - 1},
-                poly_payload=maybe_poly,
-            )
+        for row in build_atlas_rows(
+            family="regular_products",
+            family_name=name,
+            items=self._pairs(params, rows),
+        ):
+            yield row
             rows_yielded += 1
-        if rows_yielded < self.spec.rows:
+        if rows_yielded == 0:
+            raise ValueError(f"regular product source '{name}' produced no rows")
+        if rows_yielded < rows:
             raise ValueError(
-                f"regular product source '{self.spec.name}' produced "
-                f"{rows_yielded} rows, fewer than requested ({self.spec.rows})"
+                f"regular product source '{name}' produced "
+                f"{rows_yielded} rows, fewer than requested ({rows})"
             )
 
+    @staticmethod
+    def _pairs(params: Mapping[str, Any], rows: int) -> Iterator[tuple[Any, Any, Any]]:
+        # The native sampler returns None once the factor lists are exhausted.
+        for pair_index in range(rows):
+            poly = _native.rand4_regular_product_sample(params, pair_index)
+            if poly is None:
+                return
+            yield {"params": params, "pair_index": pair_index}, {"pair_index": pair_index}, poly
+
 
 class SpecialCatalogSource(AtlasSource):
     def generate(self) -> Iterator[AtlasRow]:
         members = self.spec.params.get("members") or []
         if not members:
             raise ValueError(f"special catalog '{self.spec.name}' requires params.members entries")
+        # Rows cycle through a handful of fixed shapes; build (and measure) each one once.
+        built: dict[str, AtlasRow] = {}
         for idx in range(self.spec.rows):
             ident = str(members[idx % len(members)])
-            record = special_polytope(str(ident))
-            payload = {
-                "vertices": record.vertices,
-                "halfspaces": record.halfspaces,
-            }
-            yield build_atlas_row(
-                family="special_catalog",
-                family_name=f"{self.spec.name}:{ident}",
-                family_parameters={"member": ident},
-                replay_token={"member": ident},
-                poly_payload=payload,
-            )
+            row = built.get(ident)
+            if row is None:
+                row = build_atlas_row(
+                    family="special_catalog",
+                    family_name=f"{self.spec.name}:{ident}",
+                    family_parameters={"member": ident},
+                    replay_token={"member": ident},
+                    poly_payload=special_payload(ident),
+                )
+                built[ident] = row
+            yield row
 
 
 def special_polytope(ident: str) -> PolytopeRecord:
@@ -136,29 +144,36 @@ def special_polytope(ident: str) -> PolytopeRecord:
     raise ValueError(f"unknown special catalog member '{ident}'")
 
 
+@functools.lru_cache(maxsize=32)
+def special_payload(ident: str) -> Mapping[str, Any]:
+    """Cached, read-only `{vertices, halfspaces}` payload for a catalogue member."""
+    record = special_polytope(ident)
+    return MappingProxyType(
+        {
+            "vertices": tuple(tuple(v) for v in record.vertices),
+            "halfspaces": tuple(tuple(h) for h in record.halfspaces),
+        }
+    )
+
+
+# Unit-size templates for the scaled catalogue shapes, built once at import. Rows are
+# ordered exactly as the original per-call loops emitted them (including -0.0 entries).
+_UNIT_SIGNS = np.array(list(itertools.product((-1.0, 1.0), repeat=4)))
+_AXIS_PAIRS = np.stack([np.eye(4), -np.eye(4)], axis=1).reshape(8, 4)
+_CROSS_VERTICES = np.zeros((8, 4))
+_CROSS_VERTICES[np.arange(8), np.repeat(np.arange(4), 2)] = np.tile((-1.0, 1.0), 4)
+
+
 def build_hypercube(scale: float = 1.0) -> PolytopeRecord:
-    vertices = [[sx, sy, sz, sw] for sx, sy, sz, sw in itertools.product((-scale, scale), repeat=4)]
-    halfspaces = []
-    for axis in range(4):
-        normal = [0.0, 0.0, 0.0, 0.0]
-        normal[axis] = 1.0
-        halfspaces.append([*normal, scale])
-        halfspaces.append([-normal[0], -normal[1], -normal[2], -normal[3], scale])
-    return PolytopeRecord(vertices=vertices, halfspaces=halfspaces)
+    vertices = _UNIT_SIGNS * scale
+    halfspaces = np.column_stack([_AXIS_PAIRS, np.full(8, float(scale))])
+    return PolytopeRecord(vertices=vertices.tolist(), halfspaces=halfspaces.tolist())
 
 
 def build_cross_polytope(radius: float = 1.0) -> PolytopeRecord:
-    vertices = []
-    for axis in range(4):
-        for sign in (-radius, radius):
-            vertex = [0.0, 0.0, 0.0, 0.0]
-            vertex[axis] = sign
-            vertices.append(vertex)
-    halfspaces = []
-    for signs in itertools.product((-1.0, 1.0), repeat=4):
-        normal = [signs[0], signs[1], signs[2], signs[3]]
-        halfspaces.append([*normal, radius])
-    return PolytopeRecord(vertices=vertices, halfspaces=halfspaces)
+    vertices = _CROSS_VERTICES * radius
+    halfspaces = np.column_stack([_UNIT_SIGNS, np.full(16, float(radius))])
+    return PolytopeRecord(vertices=vertices.tolist(), halfspaces=halfspaces.tolist())
 
 
 def build_simplex() -> PolytopeRecord:
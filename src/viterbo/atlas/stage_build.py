@@ -5,7 +5,7 @@ import sys
 from pathlib import Path
 
 from .config import AtlasConfig
-from .dataset import build_dataset, write_dataset
+from .dataset import build_and_write_dataset
 from .visualize import write_preview
 
 
@@ -28,12 +28,11 @@ def main(argv: list[str] | None = None) -> int:
     if args.preview_only:
         return _run_preview_only(cfg)
 
-    df = build_dataset(cfg)
-    dataset_path = write_dataset(cfg, df)
+    dataset_path, rows = build_and_write_dataset(cfg)
     if cfg.out.preview:
-        write_preview(df, cfg.out.preview, limit=cfg.out.preview_limit)
+        write_preview(dataset_path, cfg.out.preview, limit=cfg.out.preview_limit)
     print(
-        f"[atlas] wrote {len(df)} rows to {dataset_path.relative_to(Path.cwd())}",
+        f"[atlas] wrote {rows} rows to {dataset_path.relative_to(Path.cwd())}",
         file=sys.stderr,
     )
     return 0
@@ -45,6 +44,8 @@ def _run_preview_only(cfg: AtlasConfig) -> int:
     dataset_path = cfg.out.dataset
     if not dataset_path.exists():
         raise FileNotFoundError(f"dataset not found: {dataset_path}")
+    # No mtime shortcut: write_preview scans only the preview columns and leaves identical
+    # output unwritten, so a rerun is cheap and still picks up column/limit changes.
     write_preview(
         dataset_path,
         cfg.out.preview,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Sequence
@@ -19,19 +20,19 @@ class AtlasTorchDataset:
     """Tiny helper to feed atlas rows into PyTorch experiments."""
 
     def __init__(self, cfg: AtlasTorchDatasetConfig) -> None:
-        try:
-            import torch  # type: ignore
-        except ModuleNotFoundError as err:
-            raise RuntimeError("torch must be installed to use AtlasTorchDataset") from err
-
+        torch = _get_torch()
         df = pl.read_parquet(cfg.path)
-        if cfg.shuffle:
-            df = df.sample(fraction=1.0, with_replacement=False, shuffle=True)
         self._torch = torch
         self._features = _to_tensor(df, cfg.feature_columns, torch)
         self._targets = (
             _to_tensor(df, [cfg.target_column], torch).squeeze(-1) if cfg.target_column else None
         )
+        if cfg.shuffle:
+            # Permute the small float32 tensors, not the frame with its list columns.
+            perm = torch.randperm(self._features.shape[0])
+            self._features = self._features[perm]
+            if self._targets is not None:
+                self._targets = self._targets[perm]
 
     def __len__(self) -> int:
         return self._features.shape[0]
@@ -42,9 +43,21 @@ class AtlasTorchDataset:
         return self._features[idx], self._targets[idx]
 
 
+# torch is optional: import it on first use, then hand every later dataset the same module.
+@functools.lru_cache(maxsize=1)
+def _get_torch():
+    try:
+        import torch  # type: ignore
+    except ModuleNotFoundError as err:
+        raise RuntimeError("torch must be installed to use AtlasTorchDataset") from err
+    return torch
+
+
 def _to_tensor(df: pl.DataFrame, columns: Sequence[str], torch_module):
     missing = [col for col in columns if col not in df.columns]
     if missing:
         raise ValueError(f"missing columns for tensor conversion: {missing}")
-    data = df.select(columns).to_numpy()
-    return torch_module.tensor(data, dtype=torch_module.float32)
+    # Cast in Polars and build one row-major float32 buffer that torch adopts without a copy
+    # (no float64 intermediate, no second copy inside torch.tensor).
+    data = df.select(columns).cast(pl.Float32).to_numpy(order="c", writable=True)
+    return torch_module.from_numpy(data)
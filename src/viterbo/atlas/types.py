@@ -3,14 +3,15 @@ from __future__ import annotations
 import json
 import math
 from dataclasses import dataclass, field
-from typing import Any, Mapping, Sequence
+from typing import Any, Iterable, Iterator, Mapping, Sequence
+
+import numpy as np
 
 from viterbo import _native as _native_impl
 
 _NATIVE: Any = _native_impl
 
-
-@dataclass
+@dataclass(slots=True)
 class PolytopeRecord:
     """Simple in-memory representation of a 4D polytope."""
 
@@ -26,7 +27,14 @@ class PolytopeRecord:
         return len(self.halfspaces)
 
 
-@dataclass
+# `json.dumps(..., sort_keys=True)` builds a fresh JSONEncoder on every call; the atlas
+# encodes two dicts per row, so share one encoder (same output: only sort_keys differs
+# from the defaults).
+_encode_sorted_json = json.JSONEncoder(sort_keys=True).encode
+
+
+# Slotted: a large atlas holds one of these per generated row while it is being built.
+@dataclass(slots=True)
 class AtlasRow:
     family: str
     family_name: str
@@ -36,36 +44,45 @@ class AtlasRow:
     volume: float
     capacity_ehz: float
     dominant_orbit: str
-    systolic_ratio: float
-
-    def to_record(self, row_id: int) -> dict[str, Any]:
-        return {
-            "row_id": row_id,
-            "family": self.family,
-            "family_name": self.family_name,
-            "family_parameters": json.dumps(self.family_parameters, sort_keys=True),
-            "replay_token": json.dumps(self.replay_token, sort_keys=True),
-            "vertex_count": self.polytope.vertex_count,
-            "halfspace_count": self.polytope.halfspace_count,
-            "vertices": self.polytope.vertices,
-            "halfspaces": self.polytope.halfspaces,
-            "volume": self.volume,
-            "capacity_ehz": self.capacity_ehz,
-            "dominant_orbit": self.dominant_orbit,
-            "systolic_ratio": self.systolic_ratio,
-        }
+
+    def append_to(self, columns: Mapping[str, list[Any]]) -> None:
+        """Append this row's stored fields to the per-column lists of a dataset being built.
+
+        Derived columns (row id, counts, systolic ratio) are filled in per batch by the
+        dataset writer, not row by row.
+        """
+        columns["family"].append(self.family)
+        columns["family_name"].append(self.family_name)
+        columns["family_parameters"].append(_encode_sorted_json(self.family_parameters))
+        columns["replay_token"].append(_encode_sorted_json(self.replay_token))
+        columns["vertices"].append(self.polytope.vertices)
+        columns["halfspaces"].append(self.polytope.halfspaces)
+        columns["volume"].append(self.volume)
+        columns["capacity_ehz"].append(self.capacity_ehz)
+        columns["dominant_orbit"].append(self.dominant_orbit)
 
 
 def poly_dict_to_record(payload: Mapping[str, Any]) -> PolytopeRecord:
-    vertices = [
-        [float(c) for c in seq] for seq in _expect_sequence(payload.get("vertices"), "vertices")
-    ]
-    halfspaces = [
-        [float(c) for c in seq] for seq in _expect_sequence(payload.get("halfspaces"), "halfspaces")
-    ]
+    vertices = _as_float_rows(_expect_sequence(payload.get("vertices"), "vertices"), "vertices")
+    halfspaces = _as_float_rows(
+        _expect_sequence(payload.get("halfspaces"), "halfspaces"), "halfspaces"
+    )
     return PolytopeRecord(vertices=vertices, halfspaces=halfspaces)
 
 
+def _as_float_rows(rows: Sequence[Sequence[float]], label: str) -> list[list[float]]:
+    """Cast a list of coordinate rows to floats in one NumPy pass (not one `float()` per entry)."""
+    message = f"{label} must be a list of equal-length coordinate rows"
+    try:
+        array = np.asarray(rows, dtype=np.float64)
+    except ValueError as err:
+        # Ragged rows: NumPy's own "inhomogeneous shape" error would not name the field.
+        raise ValueError(message) from err
+    if array.ndim != 2 and array.size:
+        raise ValueError(message)
+    return array.tolist()
+
+
 def _halfspaces_for_native(
     poly: PolytopeRecord,
 ) -> list[tuple[tuple[float, float, float, float], float]]:
@@ -73,25 +90,43 @@ def _halfspaces_for_native(
     for h in poly.halfspaces:
         if len(h) != 5:
             raise ValueError("halfspaces must be length-5 lists [n0,n1,n2,n3,c]")
-        normal = (float(h[0]), float(h[1]), float(h[2]), float(h[3]))
-        hs_for_native.append((normal, float(h[4])))
+        hs_for_native.append(((h[0], h[1], h[2], h[3]), h[4]))
     return hs_for_native
 
 
+# A bounded polytope in R^4 needs at least five facets; anything with fewer half-spaces
+# is unbounded or empty, and both measurements would come back NaN anyway.
+_MIN_BOUNDED_HALFSPACES = 5
+
+
 def compute_volume(poly: PolytopeRecord) -> float:
     """Use the native helper to compute 4D volume from half-spaces."""
 
-    hs_for_native = _halfspaces_for_native(poly)
+    return _volume_from_native(_halfspaces_for_native(poly))
+
+
+def compute_capacity(poly: PolytopeRecord) -> float:
+    """Compute c_EHZ using the oriented-edge solver (returns NaN on failure)."""
+
+    return _capacity_from_native(_halfspaces_for_native(poly))
+
+
+def _volume_from_native(
+    hs_for_native: list[tuple[tuple[float, float, float, float], float]],
+) -> float:
+    if len(hs_for_native) < _MIN_BOUNDED_HALFSPACES:
+        return math.nan
     try:
         return float(_NATIVE.poly4_volume_from_halfspaces(hs_for_native))
     except Exception:
         return math.nan
 
 
-def compute_capacity(poly: PolytopeRecord) -> float:
-    """Compute c_EHZ using the oriented-edge solver (returns NaN on failure)."""
-
-    hs_for_native = _halfspaces_for_native(poly)
+def _capacity_from_native(
+    hs_for_native: list[tuple[tuple[float, float, float, float], float]],
+) -> float:
+    if len(hs_for_native) < _MIN_BOUNDED_HALFSPACES:
+        return math.nan
     try:
         result = _NATIVE.poly4_capacity_ehz_from_halfspaces(hs_for_native)
     except Exception:
@@ -107,37 +142,56 @@ def build_atlas_row(
     *,
     family: str,
     family_name: str,
-    family_parameters: Mapping[str, Any],
-    replay_token: Mapping[str, Any],
+    family_parameters: dict[str, Any],
+    replay_token: dict[str, Any],
     poly_payload: Mapping[str, Any],
     capacity_ehz: float | None = None,
     orbit_label: str | None = None,
 ) -> AtlasRow:
+    """Measure a polytope payload and wrap it as a row.
+
+    The row takes ownership of `family_parameters` and `replay_token` (no defensive
+    copies per row), so pass freshly built dicts.
+    """
     record = poly_dict_to_record(poly_payload)
-    volume = compute_volume(record)
+    # Both native measurements take the same H-representation; build it once per row.
+    hs_for_native = _halfspaces_for_native(record)
+    volume = _volume_from_native(hs_for_native)
     if capacity_ehz is not None:
         capacity = float(capacity_ehz)
     else:
-        capacity = compute_capacity(record)
+        capacity = _capacity_from_native(hs_for_native)
     orbit = orbit_label or "unavailable"
-    systolic = systolic_ratio(capacity, volume)
     return AtlasRow(
         family=family,
         family_name=family_name,
-        family_parameters=dict(family_parameters),
-        replay_token=dict(replay_token),
+        family_parameters=family_parameters,
+        replay_token=replay_token,
         polytope=record,
         volume=volume,
         capacity_ehz=capacity,
         dominant_orbit=orbit,
-        systolic_ratio=systolic,
     )
 
 
-def systolic_ratio(capacity: float, volume: float) -> float:
-    if math.isnan(capacity) or math.isnan(volume) or volume <= 0.0:
-        return math.nan
-    return (capacity * capacity) / (2.0 * volume)
+def build_atlas_rows(
+    *,
+    family: str,
+    family_name: str,
+    items: Iterable[tuple[dict[str, Any], dict[str, Any], Mapping[str, Any]]],
+) -> Iterator[AtlasRow]:
+    """Lazy `build_atlas_row` over `(family_parameters, replay_token, poly_payload)` items.
+
+    Items are consumed one at a time, so a source of any size holds a single payload.
+    """
+    for family_parameters, replay_token, poly_payload in items:
+        yield build_atlas_row(
+            family=family,
+            family_name=family_name,
+            family_parameters=family_parameters,
+            replay_token=replay_token,
+            poly_payload=poly_payload,
+        )
 
 
 def _expect_sequence(value: Any, label: str) -> Sequence[Sequence[float]]:
@@ -25,24 +25,33 @@ def write_preview(
     limit: int = 32,
     columns: Sequence[str] | None = None,
 ) -> Path:
-    df = dataset if isinstance(dataset, pl.DataFrame) else pl.read_parquet(dataset)
     cols = list(columns) if columns is not None else DEFAULT_PREVIEW_COLUMNS
-    missing = [col for col in cols if col not in df.columns]
+    # A Parquet path is scanned lazily with the projection and row limit pushed into the
+    # scan, so the heavy nested geometry columns are never decoded.
+    frame = dataset.lazy() if isinstance(dataset, pl.DataFrame) else pl.scan_parquet(dataset)
+    available = frame.collect_schema().names()
+    missing = [col for col in cols if col not in available]
     if missing:
         raise ValueError(f"preview columns missing from dataframe: {missing}")
-    preview_df = df.select(cols).head(limit)
-    float_exprs = [
-        pl.col(name).fill_nan(None)
-        for name, dtype in zip(preview_df.columns, preview_df.dtypes)
-        if dtype in (pl.Float32, pl.Float64)
-    ]
-    if float_exprs:
-        preview_df = preview_df.with_columns(float_exprs)
+    # NaN is not valid JSON: null it out for every float column via one dtype selector.
+    preview_df = (
+        frame.select(cols)
+        .head(limit)
+        .with_columns(pl.col(pl.Float32, pl.Float64).fill_nan(None))
+        .collect()
+    )
     preview_payload = {
         "columns": cols,
         "rows": preview_df.to_dicts(),
         "row_limit": limit,
     }
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(json.dumps(preview_payload, indent=2), encoding="utf-8")
+    encoded = json.dumps(preview_payload, indent=2).encode("utf-8")
+    # Previews are committed and embedded by mdBook: leave identical content unwritten (and
+    # its mtime untouched) so an unchanged preview does not trigger a rebuild.
+    try:
+        if out_path.read_bytes() == encoded:
+            return out_path
+    except FileNotFoundError:
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_bytes(encoded)
     return out_path
@@ -10,14 +10,20 @@ from __future__ import annotations
 import argparse
 import csv
 import datetime as dt
+import functools
 import json
+import os
 import platform
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, List
 
+import numpy as np
+
 REPO_ROOT = Path(__file__).resolve().parents[3]
 DEFAULT_CONFIG = REPO_ROOT / "configs" / "bench" / "docs_local.json"
 
@@ -30,7 +36,7 @@ class StageConfig:
 
     @classmethod
     def from_json(cls, path: Path) -> StageConfig:
-        data = json.loads(path.read_text())
+        data = json.loads(path.read_bytes())
         bench_root = resolve_path(data.get("bench_root", "data/bench/criterion"))
         assets_root = resolve_path(data.get("assets_root", "docs/assets/bench"))
         keep = int(data.get("keep", 5))
@@ -38,10 +44,10 @@ class StageConfig:
 
 
 def resolve_path(raw: str | Path) -> Path:
+    # REPO_ROOT is already resolved, so anchoring a relative path is a pure join; no
+    # realpath walk over the filesystem per call.
     path = Path(raw)
-    if not path.is_absolute():
-        path = (REPO_ROOT / path).resolve()
-    return path
+    return path if path.is_absolute() else REPO_ROOT / path
 
 
 def parse_args() -> argparse.Namespace:
@@ -60,11 +66,20 @@ def parse_args() -> argparse.Namespace:
 
 def gather_context() -> dict[str, str]:
     timestamp = dt.datetime.now(dt.timezone.utc)
-    git_commit = run_command(["git", "rev-parse", "HEAD"]) or "unknown"
-    rustc = run_command(["rustc", "--version"])
     return {
         "timestamp": timestamp.isoformat(),
         "timestamp_label": timestamp.strftime("%Y-%m-%d %H:%M:%SZ"),
+        **static_context(),
+    }
+
+
+# Commit, toolchain, and host facts are fixed for the process: run the git/rustc
+# subprocesses and platform probes once, however often the context is gathered.
+@functools.lru_cache(maxsize=1)
+def static_context() -> dict[str, str]:
+    git_commit = run_command(["git", "rev-parse", "HEAD"]) or "unknown"
+    rustc = run_command(["rustc", "--version"])
+    return {
         "git_commit": git_commit,
         "git_short": git_commit[:7] if git_commit else "",
         "hostname": platform.node(),
@@ -83,6 +98,7 @@ def run_command(cmd: List[str]) -> str:
 
 def collect_group_rows(group_dir: Path, context: dict[str, str]) -> List[dict[str, object]]:
     rows: List[dict[str, object]] = []
+    entries: List[tuple[Path, str, str]] = []
     for estimates_path in sorted(group_dir.glob("**/new/estimates.json")):
         rel = estimates_path.relative_to(group_dir)
         parts = rel.parts
@@ -93,21 +109,29 @@ def collect_group_rows(group_dir: Path, context: dict[str, str]) -> List[dict[st
             bench_name, parameter = group_dir.name, parts[0]
         else:
             continue
-        estimates = json.loads(estimates_path.read_text())
+        entries.append((estimates_path, bench_name, parameter))
+
+    # Criterion trees are many tiny files: overlap their reads on a thread pool (map keeps
+    # the sorted order), then assemble the rows here.
+    with ThreadPoolExecutor() as pool:
+        loaded = list(pool.map(load_estimates, [path for path, _, _ in entries]))
+
+    for (_, bench_name, parameter), (estimates, sample) in zip(entries, loaded):
         mean_ns = estimates.get("mean", {}).get("point_estimate")
         std_ns = estimates.get("std_dev", {}).get("point_estimate")
         median_ns = estimates.get("median", {}).get("point_estimate")
 
-        sample_file = estimates_path.parent / "sample.json"
         min_ns, sample_count = None, 0
-        if sample_file.exists():
-            sample = json.loads(sample_file.read_text())
-            iters = sample.get("iters", [])
-            totals = sample.get("total_times") or sample.get("times", [])
+        if sample is not None:
+            iters = np.asarray(sample.get("iters", []), dtype=np.float64)
+            totals = np.asarray(
+                sample.get("total_times") or sample.get("times", []), dtype=np.float64
+            )
             sample_count = min(len(iters), len(totals))
-            per_sample = [totals[i] / iters[i] for i in range(sample_count) if iters[i]]
-            if per_sample:
-                min_ns = min(per_sample)
+            iters, totals = iters[:sample_count], totals[:sample_count]
+            measured = iters != 0
+            if measured.any():
+                min_ns = float((totals[measured] / iters[measured]).min())
 
         rows.append(
             {
@@ -131,6 +155,16 @@ def collect_group_rows(group_dir: Path, context: dict[str, str]) -> List[dict[st
     return rows
 
 
+def load_estimates(estimates_path: Path) -> tuple[dict, dict | None]:
+    """Parse one benchmark's `estimates.json` and, if present, its sibling `sample.json`."""
+    estimates = json.loads(estimates_path.read_bytes())
+    try:
+        sample = json.loads((estimates_path.parent / "sample.json").read_bytes())
+    except FileNotFoundError:
+        sample = None
+    return estimates, sample
+
+
 def row_sort_key(row: dict[str, object]):
     bench = str(row.get("bench", ""))
     parameter = row.get("parameter")
@@ -173,26 +207,26 @@ def write_markdown(
     rows: List[dict[str, object]], destination: Path, context: dict[str, str]
 ) -> None:
     destination.parent.mkdir(parents=True, exist_ok=True)
-    lines = [
-        "| bench | parameter | samples | min (ns) | mean (ns) | stddev (ns) |",
-        "| --- | --- | ---: | ---: | ---: | ---: |",
-    ]
-    for row in rows:
-        lines.append(
-            "| {bench} | {param} | {samples} | {min_val:.3f} | {mean:.3f} | {std:.3f} |".format(
-                bench=row["bench"],
-                param=row["parameter"],
-                samples=row["samples"],
-                min_val=(row["min_ns"] or 0.0),
-                mean=(row["mean_ns"] or 0.0),
-                std=(row["stddev_ns"] or 0.0),
+    row_template = "| {bench} | {param} | {samples} | {min_val:.3f} | {mean:.3f} | {std:.3f} |\n"
+    # Stream into the buffered handle rather than joining the whole table in memory first.
+    with destination.open("w", encoding="utf-8") as handle:
+        handle.write("| bench | parameter | samples | min (ns) | mean (ns) | stddev (ns) |\n")
+        handle.write("| --- | --- | ---: | ---: | ---: | ---: |\n")
+        for row in rows:
+            handle.write(
+                row_template.format(
+                    bench=row["bench"],
+                    param=row["parameter"],
+                    samples=row["samples"],
+                    min_val=(row["min_ns"] or 0.0),
+                    mean=(row["mean_ns"] or 0.0),
+                    std=(row["stddev_ns"] or 0.0),
+                )
             )
+        handle.write("\n")
+        handle.write(
+            f"_Updated {context['timestamp_label']} · commit {context['git_short']} · host {context['hostname']} · rustc {context['rustc']}_\n"
         )
-    lines.append("")
-    lines.append(
-        f"_Updated {context['timestamp_label']} · commit {context['git_short']} · host {context['hostname']} · rustc {context['rustc']}_"
-    )
-    destination.write_text("\n".join(lines) + "\n", encoding="utf-8")
 
 
 def write_provenance(
@@ -226,8 +260,16 @@ def prune_history(group: str, assets_root: Path, keep: int, extension: str) -> N
 
 
 def update_symlink(link_path: Path, target_name: str) -> None:
-    if link_path.exists() or link_path.is_symlink():
-        link_path.unlink()
+    # One readlink answers both "is there a link?" and "is it already correct?".
+    try:
+        if os.readlink(link_path) == target_name:
+            return
+    except FileNotFoundError:
+        link_path.symlink_to(target_name)
+        return
+    except OSError:
+        pass  # a regular file in the way; replace it below
+    link_path.unlink()
     link_path.symlink_to(target_name)
 
 
@@ -255,9 +297,14 @@ def run_stage(cfg: StageConfig, context: dict[str, str]) -> None:
         write_provenance(csv_path, context, rows)
         update_symlink(assets_root / f"current_{group_dir.name}.csv", csv_path.name)
         update_symlink(assets_root / f"current_{group_dir.name}.md", md_path.name)
-        # Write/overwrite the mirrored mdBook-src copy with the current snapshot content.
+        # Point the mirrored mdBook-src file at the current snapshot: a hard link when both
+        # trees share a filesystem, otherwise a kernel-side copy.
         mirror_md = assets_src_md_root / f"current_{group_dir.name}.md"
-        mirror_md.write_text(md_path.read_text(encoding="utf-8"), encoding="utf-8")
+        mirror_md.unlink(missing_ok=True)
+        try:
+            os.link(md_path, mirror_md)
+        except OSError:
+            shutil.copyfile(md_path, mirror_md)
         prune_history(group_dir.name, assets_root, cfg.keep, ".csv")
         prune_history(group_dir.name, assets_root, cfg.keep, ".md")
         try:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import json
 import os
 import shlex
@@ -10,6 +11,8 @@ from pathlib import Path
 from typing import Any, Dict, Mapping, MutableMapping, Optional
 
 
+# One `git rev-parse` per process: sidecars written by the same run share a commit.
+@functools.lru_cache(maxsize=1)
 def _git_rev() -> Optional[str]:
     try:
         out = subprocess.check_output(["git", "rev-parse", "--short=12", "HEAD"], text=True).strip()
@@ -30,10 +33,17 @@ def write(
     output_path: os.PathLike[str] | str,
     config: Mapping[str, Any],
     extras: Optional[Mapping[str, Any]] = None,
+    *,
+    atomic: bool = True,
+    pretty: bool = False,
 ) -> Path:
     """
     Write a small JSON sidecar next to an artifact.
     Always writes `<artifact>.<ext>.run.json` and embeds the (possibly mutated) config.
+    With `atomic=False` the sidecar is written in place (no temp file + rename); use it for
+    sidecars that are regenerated together with their artifact on every run.
+    Sidecars are compact, key-sorted JSON (they live in LFS and are read by tools);
+    `pretty=True` indents them for debugging.
     """
     out = Path(output_path)
     sidecar = _sidecar_path(out)
@@ -47,9 +57,13 @@ def write(
     if extras:
         payload.update(extras)
 
-    tmp = sidecar.with_suffix(sidecar.suffix + ".tmp")
-    with tmp.open("w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2, sort_keys=True)
+    target = sidecar.with_suffix(sidecar.suffix + ".tmp") if atomic else sidecar
+    with target.open("w", encoding="utf-8") as f:
+        if pretty:
+            json.dump(payload, f, indent=2, sort_keys=True)
+        else:
+            json.dump(payload, f, separators=(",", ":"), sort_keys=True)
         f.write("\n")
-    tmp.replace(sidecar)
+    if atomic:
+        target.replace(sidecar)
     return sidecar
@@ -27,7 +27,7 @@ def test_build_dataset_tiny(tmp_path: Path):
     assert sidecar.exists(), "provenance sidecar missing"
     assert preview_path.exists(), "preview asset missing"
 
-    df = pl.read_parquet(dataset_path)
+    dataset = pl.scan_parquet(dataset_path)
     required_cols = {
         "row_id",
         "family",
@@ -37,8 +37,15 @@ def test_build_dataset_tiny(tmp_path: Path):
         "volume",
         "systolic_ratio",
     }
-    assert required_cols.issubset(set(df.columns))
-    hypercube = df.filter(pl.col("family_name").str.contains("hypercube")).to_dicts()
+    assert required_cols.issubset(set(dataset.collect_schema().names()))
+    # Lazy filter: Polars prunes row groups from the Parquet statistics and reads only
+    # the projected columns.
+    hypercube = (
+        dataset.filter(pl.col("family_name").str.contains("hypercube"))
+        .select("volume", "capacity_ehz", "systolic_ratio")
+        .collect()
+        .to_dicts()
+    )
     assert hypercube, "expected hypercube row in special catalog"
     assert hypercube[0]["volume"] == pytest.approx(16.0, rel=1e-6)
     assert hypercube[0]["capacity_ehz"] == pytest.approx(4.0, rel=1e-6)
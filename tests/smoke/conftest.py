@@ -0,0 +1,18 @@
+import importlib
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def native() -> SimpleNamespace:
+    """The Python facade (`mod`) and the compiled extension (`ext`), imported once per session.
+
+    `so_path` is the extension's file location (None if the loader reports none).
+    """
+    from viterbo import _native
+
+    ext = importlib.import_module("viterbo.viterbo_native")
+    so_path = Path(ext.__file__) if ext.__file__ is not None else None
+    return SimpleNamespace(mod=_native, ext=ext, so_path=so_path)
@@ -0,0 +1,47 @@
+from pathlib import Path
+
+import pytest
+
+from viterbo.atlas import dataset
+from viterbo.atlas.config import AtlasConfig
+
+
+def _hypercube_config(tmp_path: Path) -> AtlasConfig:
+    return AtlasConfig.from_mapping(
+        {
+            "version": 3,
+            "seed": 7,
+            "sources": [
+                {
+                    "name": "catalog",
+                    "family": "special_catalog",
+                    "rows": 3,
+                    "params": {"members": ["hypercube"]},
+                }
+            ],
+            "out": {"dataset": str(tmp_path / "atlas.parquet")},
+        },
+        base_dir=tmp_path,
+    )
+
+
+def test_failed_build_keeps_previous_dataset(tmp_path, monkeypatch):
+    cfg = _hypercube_config(tmp_path)
+    out_path, rows = dataset.build_and_write_dataset(cfg)
+    assert rows == 3
+    sidecar = tmp_path / "atlas.parquet.run.json"
+    before = out_path.read_bytes(), sidecar.read_bytes()
+
+    iter_rows = dataset._iter_rows
+
+    def failing_rows(cfg):
+        yield from iter_rows(cfg)
+        raise RuntimeError("source failed mid-stream")
+
+    monkeypatch.setattr(dataset, "_iter_rows", failing_rows)
+    # batch_size=1: record batches have already been written when the source fails.
+    with pytest.raises(RuntimeError, match="mid-stream"):
+        dataset.build_and_write_dataset(cfg, batch_size=1)
+
+    assert (out_path.read_bytes(), sidecar.read_bytes()) == before
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["atlas.parquet", sidecar.name]
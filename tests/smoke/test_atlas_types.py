@@ -0,0 +1,12 @@
+import pytest
+
+from viterbo.atlas.types import poly_dict_to_record
+
+
+def test_ragged_vertices_name_the_field():
+    payload = {
+        "vertices": [[0.0, 0.0, 0.0, 0.0], [1.0, 0.0, 0.0]],
+        "halfspaces": [[1.0, 0.0, 0.0, 0.0, 1.0]],
+    }
+    with pytest.raises(ValueError, match="vertices must be a list of equal-length"):
+        poly_dict_to_record(payload)